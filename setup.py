@@ -1,3 +1,4 @@
+from os import environ
 from setuptools import find_packages, setup
 
 
@@ -6,6 +7,28 @@ with open("README.md", "r") as file_:
 
 production_requirements = []
 
+optional_requirements = {
+    "fast": ["orjson"],
+}
+
+# Setting SLACKBLOCKS_USE_MYPYC=1 compiles the serialisation modules to C
+# extensions with mypyc (which must be installed). The pure Python sources are
+# used wherever they haven't been compiled. elements.py stays interpreted as
+# mypyc's native classes can't be weakly referenced (see Text.get), and
+# block_list.py as mypyc can't compile subclasses of list. The public classes in
+# the compiled modules are marked with mypyc_attr so they can still be
+# subclassed from interpreted code.
+if environ.get("SLACKBLOCKS_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        "slackblocks/attachments.py",
+        "slackblocks/blocks.py",
+        "slackblocks/messages.py",
+        "slackblocks/utils.py",
+    ])
+else:
+    ext_modules = []
+
 setup(
     name="slackblocks",
     version="0.2.2",
@@ -13,10 +36,12 @@ setup(
     author_email="nick@ndl.im",
     description="Python wrapper for the Slack Blocks API",
     install_requires=production_requirements,
+    extras_require=optional_requirements,
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/nicklambourne/slackblocks",
     packages=find_packages(".", exclude=["test"]),
+    ext_modules=ext_modules,
     include_package_data=True,
     setup_requires=[
         "pytest",
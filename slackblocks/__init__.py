@@ -1,6 +1,7 @@
 from .attachments import Attachment, Color, Field
-from .blocks import ActionsBlock, ContextBlock, DividerBlock, FileBlock, ImageBlock, SectionBlock,\
-    HeaderBlock
+from .block_list import BlockList
+from .blocks import ActionsBlock, ContextBlock, DividerBlock, FileBlock, ImageBlock, \
+    SectionBlock, HeaderBlock
 from .elements import Button, Confirm, Element, Image, Text, TextType
 from .messages import MessageResponse, Message
 
@@ -3,6 +3,7 @@ from json import dumps
 from typing import Any, Dict, List, Optional, Union
 from .blocks import Block
 from .errors import InvalidUsageError
+from .utils import mypyc_attr
 
 
 class Color(Enum):
@@ -21,10 +22,13 @@ class Color(Enum):
     BLACK = "#000000"
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class Field:
     """
     Field text objects for use with Slack's secondary attachment API.
     """
+    __slots__ = ("title", "value", "short")
+
     def __init__(self,
                  title: Optional[str] = None,
                  value: Optional[str] = None,
@@ -33,9 +37,8 @@ class Field:
         self.value = value
         self.short = short
 
-    def _resolve(self):
-        field = dict()
-        field["short"] = self.short
+    def _resolve(self) -> str:
+        field: Dict[str, Any] = {"short": self.short}
         if self.title:
             field["title"] = self.title
         if self.value:
@@ -43,24 +46,29 @@ class Field:
         return dumps(field)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class Attachment:
     """
     Secondary content can be attached to messages to include lower priority content
      - content that doesn't necessarily need to be seen to appreciate the intent of
     the message, but perhaps adds further context or additional information.
     """
+    __slots__ = ("blocks", "color")
+    blocks: Optional[List[Block]]
+    color: Optional[str]
+
     def __init__(self,
                  blocks: Optional[Union[List[Block], Block]] = None,
                  color: Optional[Union[str, Color]] = None):
-        if isinstance(blocks, List):
+        if isinstance(blocks, list):
             self.blocks = blocks
         elif isinstance(blocks, Block):
             self.blocks = [blocks, ]
         else:
             self.blocks = None
-        if type(color) is Color:
+        if isinstance(color, Color):
             self.color = color.value
-        elif type(color) is str:
+        elif isinstance(color, str):
             if len(color) == 7 and color.startswith("#"):
                 self.color = color
             else:
@@ -69,7 +77,7 @@ class Attachment:
             self.color = None
 
     def _resolve(self) -> Dict[str, Any]:
-        attachment = dict()
+        attachment: Dict[str, Any] = {}
         if self.blocks:
             attachment["blocks"] = [block._resolve() for block in self.blocks]
         if self.color:
@@ -0,0 +1,40 @@
+from collections.abc import Iterable as IterableABC, Mapping
+from typing import TYPE_CHECKING, Iterable, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .blocks import Block
+
+# BlockList lives outside of blocks.py so that module can still be compiled with
+# mypyc, which can't compile subclasses of list.
+
+
+class BlockList(list):
+    """
+    A list of blocks, as produced by adding blocks together
+    (e.g. `block_0 + block_1 + block_2`). Blocks or iterables of blocks can be
+    added to it; prefer `+=` when building up a long list, as it extends the
+    list in place rather than copying it.
+    """
+    def __add__(self,  # type: ignore[override]
+                other: Union["Block", Iterable["Block"]]) -> "BlockList":
+        result = BlockList(self)
+        result += other
+        return result
+
+    def __iadd__(self,  # type: ignore[override]
+                 other: Union["Block", Iterable["Block"]]) -> "BlockList":
+        # Imported here as blocks.py imports this module.
+        from .blocks import Block
+        if isinstance(other, Block):
+            self.append(other)
+            return self
+        # Strings and mappings are iterable but never hold blocks.
+        if isinstance(other, IterableABC) and not isinstance(other, (str, Mapping)):
+            others = list(other)
+            if all(isinstance(block, Block) for block in others):
+                self.extend(others)
+                return self
+        raise TypeError(
+            "can only add a Block or an iterable of Blocks to a BlockList, "
+            "not {!r}".format(type(other).__name__)
+        )
@@ -1,10 +1,11 @@
-from abc import abstractmethod, ABC
+from abc import abstractmethod, ABCMeta
 from enum import Enum
-from json import dumps
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Union
 from uuid import uuid4
+from .block_list import BlockList
 from .elements import Element, ElementType, Text, TextType
 from .errors import InvalidUsageError
+from .utils import mypyc_attr, serialise
 
 
 class BlockType(Enum):
@@ -21,40 +22,81 @@ class BlockType(Enum):
     HEADER = "header"
 
 
-class Block(ABC):
+@mypyc_attr(allow_interpreted_subclasses=True)
+class Block(metaclass=ABCMeta):
     """
     Basis block containing attributes and behaviour common to all blocks.
     N.B: Block is an abstract class and cannot be sent directly.
     """
+    __slots__ = ("type", "_block_id", "_base")
+    _TYPE_STR: ClassVar[Optional[str]] = None
+    _block_id: Optional[str]
+    _base: Dict[str, Any]
+
     def __init__(self,
                  type_: BlockType,
                  block_id: Optional[str] = None):
         self.type = type_
-        self.block_id = block_id if block_id else str(uuid4())
+        self._set_block_id(block_id)
+
+    @property
+    def block_id(self) -> str:
+        """
+        The block's identifier. If one wasn't supplied, a random UUID is
+        generated the first time it's accessed; until then the block is sent
+        without one, which Slack accepts.
+        """
+        block_id = self._block_id
+        if block_id is None:
+            block_id = str(uuid4())
+            self._set_block_id(block_id)
+        return block_id
+
+    @block_id.setter
+    def block_id(self, block_id: str) -> None:
+        self._set_block_id(block_id)
 
-    def __add__(self, other: "Block"):
-        return [self, other]
+    def _set_block_id(self, block_id: Optional[str]) -> None:
+        self._block_id = block_id or None
+        # The attributes shared by every block only change with the id, so
+        # they're built here once and copied by each _resolve().
+        base: Dict[str, Any] = {"type": self._TYPE_STR or self.type.value}
+        if self._block_id is not None:
+            base["block_id"] = self._block_id
+        self._base = base
 
-    def _attributes(self):
-        return {
-            "type": self.type.value,
-            "block_id": self.block_id
-        }
+    def __add__(self, other: Union["Block", Iterable["Block"]]) -> "BlockList":
+        return BlockList([self]) + other
+
+    def _attributes(self) -> Dict[str, Any]:
+        return self._base.copy()
 
     @abstractmethod
-    def _resolve(self) -> Dict[str, any]:
+    def _resolve(self) -> Dict[str, Any]:
         pass
 
+    def to_json(self, *, pretty: bool = False) -> str:
+        """
+        Serialise the block to a JSON string. Pretty-printed output (four space
+        indent) is opt-in as it's considerably slower to produce.
+        """
+        return serialise(self._resolve(), pretty=pretty)
+
     def __repr__(self) -> str:
-        return dumps(self._resolve(), indent=4)
+        # Deliberately cheap: use to_json() for the serialised block.
+        return "<{} block_id={!r}>".format(type(self).__name__, self._block_id)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class SectionBlock(Block):
     """
     A section is one of the most flexible blocks available -
     it can be used as a simple text block, in combination with text fields,
     or side-by-side with any of the available block elements.
     """
+    __slots__ = ("text", "fields", "accessory")
+    _TYPE_STR = BlockType.SECTION.value
+
     def __init__(self,
                  text: Union[str, Text],
                  block_id: Optional[str] = None,
@@ -62,15 +104,15 @@ class SectionBlock(Block):
                  accessory: Optional[Element] = None):
         super().__init__(type_=BlockType.SECTION,
                          block_id=block_id)
-        if type(text) is Text:
+        if isinstance(text, Text):
             self.text = text
         else:
-            self.text = Text(text)
+            self.text = Text.get(text)
         self.fields = fields
         self.accessory = accessory
 
     def _resolve(self) -> Dict[str, Any]:
-        section = self._attributes()
+        section = self._base.copy()
         section["text"] = self.text._resolve()
         if self.fields:
             section["fields"] = [field._resolve() for field in self.fields]
@@ -79,23 +121,31 @@ class SectionBlock(Block):
         return section
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class DividerBlock(Block):
     """
     A content divider, like an <hr>, to split up different blocks inside of
     a message. The divider block is nice and neat, requiring only a type.
     """
+    __slots__ = ()
+    _TYPE_STR = BlockType.DIVIDER.value
+
     def __init__(self, block_id: Optional[str] = None):
         super().__init__(type_=BlockType.DIVIDER,
                          block_id=block_id)
 
-    def _resolve(self):
-        return self._attributes()
+    def _resolve(self) -> Dict[str, Any]:
+        return self._base.copy()
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ImageBlock(Block):
     """
     A simple image block, designed to make those cat photos really pop.
     """
+    __slots__ = ("image_url", "alt_text", "title")
+    _TYPE_STR = BlockType.IMAGE.value
+
     def __init__(self,
                  image_url: str,
                  alt_text: Optional[str] = "",
@@ -105,23 +155,23 @@ class ImageBlock(Block):
                          block_id=block_id)
         self.image_url = image_url
         self.alt_text = alt_text
-        if title and type(title) is Text:
+        if isinstance(title, Text):
             if title.text_type == TextType.MARKDOWN:
-                self.title = Text(text=title.text,
-                                  type_=TextType.PLAINTEXT,
-                                  emoji=title.emoji,
-                                  verbatim=title.verbatim)
+                self.title = Text.get(text=title.text,
+                                      type_=TextType.PLAINTEXT,
+                                      emoji=title.emoji,
+                                      verbatim=title.verbatim)
             else:
                 self.title = title
         elif title:
-            self.title = Text(text=title,
-                              type_=TextType.PLAINTEXT)
+            self.title = Text.get(text=title,
+                                  type_=TextType.PLAINTEXT)
         else:
-            self.title = Text(text=" ",
-                              type_=TextType.PLAINTEXT)
+            self.title = Text.get(text=" ",
+                                  type_=TextType.PLAINTEXT)
 
     def _resolve(self) -> Dict[str, Any]:
-        image = self._attributes()
+        image = self._base.copy()
         image["image_url"] = self.image_url
         image["alt_text"] = self.alt_text
         if self.title:
@@ -129,56 +179,68 @@ class ImageBlock(Block):
         return image
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ActionsBlock(Block):
     """
     A block that is used to hold interactive elements.
     """
+    __slots__ = ("elements",)
+    _TYPE_STR = BlockType.ACTIONS.value
+    elements: List[Element]
+
     def __init__(self,
-                 elements: Optional[List[Element]] = None,
+                 elements: Optional[Union[List[Element], Element]] = None,
                  block_id: Optional[str] = None):
         super().__init__(type_=BlockType.ACTIONS,
                          block_id=block_id)
         if isinstance(elements, Element):
             self.elements = [elements, ]
-        elif (isinstance(elements, list) and
-              all([isinstance(el, Element) for el in elements])):
-            self.elements = elements
+        else:
+            self.elements = elements or []
 
-    def _resolve(self):
-        actions = self._attributes()
+    def _resolve(self) -> Dict[str, Any]:
+        actions = self._base.copy()
         actions["elements"] = [element._resolve() for element in self.elements]
         return actions
 
 
+_CONTEXT_ELEMENT_TYPES = frozenset((ElementType.TEXT, ElementType.IMAGE))
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ContextBlock(Block):
     """
     Displays message context, which can include both images and text.
     """
+    __slots__ = ("elements",)
+    _TYPE_STR = BlockType.CONTEXT.value
+
     def __init__(self,
                  elements: Optional[List[Element]] = None,
                  block_id: Optional[str] = None):
         super().__init__(type_=BlockType.CONTEXT,
                          block_id=block_id)
-        self.elements = []
-        for element in elements:
-            if element.type == ElementType.TEXT or \
-                    element.type == ElementType.IMAGE:
-                self.elements.append(element)
-            else:
+        self.elements = list(elements or [])
+        for element in self.elements:
+            if element.type not in _CONTEXT_ELEMENT_TYPES:
                 raise InvalidUsageError("Context blocks can only hold image and text elements")
         if len(self.elements) > 10:
             raise InvalidUsageError("Context blocks can hold a maximum of ten elements")
 
-    def _resolve(self) -> Dict[str, any]:
-        context = self._attributes()
+    def _resolve(self) -> Dict[str, Any]:
+        context = self._base.copy()
         context["elements"] = [element._resolve() for element in self.elements]
         return context
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class FileBlock(Block):
     """
     Displays a remote file.
     """
+    __slots__ = ("external_id", "source")
+    _TYPE_STR = BlockType.FILE.value
+
     def __init__(self,
                  external_id: str,
                  source: str,
@@ -188,27 +250,31 @@ class FileBlock(Block):
         self.external_id = external_id
         self.source = source
 
-    def _resolve(self) -> Dict[str, any]:
-        file = self._attributes()
+    def _resolve(self) -> Dict[str, Any]:
+        file = self._base.copy()
         file["external_id"] = self.external_id
         file["source"] = self.source
         return file
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class HeaderBlock(Block):
     """
     A header is a plain-text block that displays in a larger, bold font.
     """
+    __slots__ = ("text",)
+    _TYPE_STR = BlockType.HEADER.value
+
     def __init__(self,
                  text: Union[str, Text],
                  block_id: Optional[str] = None):
         super().__init__(type_=BlockType.HEADER, block_id=block_id)
-        if type(text) is Text:
+        if isinstance(text, Text):
             self.text = text
         else:
-            self.text = Text(text, type_=TextType.PLAINTEXT, verbatim=False)
+            self.text = Text.get(text, type_=TextType.PLAINTEXT, verbatim=False)
 
-    def _resolve(self) -> Dict[str, any]:
-        header = self._attributes()
+    def _resolve(self) -> Dict[str, Any]:
+        header = self._base.copy()
         header["text"] = self.text._resolve()
         return header
@@ -1,8 +1,9 @@
-from abc import ABC, abstractmethod
+from abc import ABCMeta, abstractmethod
 from enum import Enum
-from json import dumps
-from typing import Any, Dict, Optional, Union
+from typing import Any, ClassVar, Dict, Optional, Tuple, Union
+from weakref import WeakValueDictionary
 from .errors import InvalidUsageError
+from .utils import serialise
 
 
 class ElementType(Enum):
@@ -25,18 +26,30 @@ class TextType(Enum):
     PLAINTEXT = "plain_text"
 
 
-class Element(ABC):
+class Element(metaclass=ABCMeta):
     """
     Basis element containing attributes and behaviour common to all elements.
     N.B: Element is an abstract class and cannot be used directly.
     """
+    __slots__ = ("_type",)
+    # The serialised type, set as a plain string by the built-in subclasses.
+    # None means use self.type.value.
+    _TYPE_STR: ClassVar[Optional[str]] = None
+
     def __init__(self, type_: ElementType):
         super().__init__()
-        self.type = type_
+        self._type = type_
+
+    @property
+    def type(self) -> ElementType:
+        """
+        The kind of element, fixed when it's created.
+        """
+        return self._type
 
     def _attributes(self) -> Dict[str, Any]:
         return {
-            "type": self.type.value
+            "type": self._TYPE_STR or self._type.value
         }
 
     @abstractmethod
@@ -44,55 +57,119 @@ class Element(ABC):
         pass
 
 
+# Text objects created by Text.get(), shared between identical uses for as
+# long as something still refers to them.
+_TEXT_POOL: "WeakValueDictionary[Tuple[str, TextType, Optional[bool], Optional[bool]], Text]" = \
+    WeakValueDictionary()
+
+
 class Text(Element):
     """
     An object containing some text, formatted either as plain_text or using
     Slack's "mrkdwn"
     """
+    __slots__ = ("_text_type", "_text", "_verbatim", "_emoji", "_resolved", "__weakref__")
+    _TYPE_STR = ElementType.TEXT.value
+    _resolved: Optional[Dict[str, Any]]
+
     def __init__(self,
                  text: str,
                  type_: TextType = TextType.MARKDOWN,
-                 emoji: bool = False,
-                 verbatim: bool = False):
+                 emoji: Optional[bool] = False,
+                 verbatim: Optional[bool] = False):
         super().__init__(type_=ElementType.TEXT)
-        self.text_type = type_
-        self.text = text
-        if self.text_type == TextType.MARKDOWN:
-            self.verbatim = verbatim
-            self.emoji = None
-        elif self.text_type == TextType.PLAINTEXT:
-            self.verbatim = None
-            self.emoji = emoji
+        # Text objects are immutable (and may be shared, see Text.get), so
+        # their fields are only exposed through read-only properties.
+        self._text_type = type_
+        self._text = text
+        self._verbatim = verbatim if type_ == TextType.MARKDOWN else None
+        self._emoji = emoji if type_ == TextType.PLAINTEXT else None
+        self._resolved = None
+
+    @property
+    def text_type(self) -> TextType:
+        return self._text_type
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @property
+    def verbatim(self) -> Optional[bool]:
+        return self._verbatim
+
+    @property
+    def emoji(self) -> Optional[bool]:
+        return self._emoji
+
+    def _key(self) -> Tuple[TextType, str, Optional[bool], Optional[bool]]:
+        return self._text_type, self._text, self._verbatim, self._emoji
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Text):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
 
     def _resolve(self) -> Dict[str, Any]:
-        text = {
-            "type": self.text_type.value,
-            "text": self.text,
-        }
-        if self.text_type == TextType.MARKDOWN:
-            text["verbatim"] = self.verbatim
-        elif self.type == TextType.PLAINTEXT and self.emoji:
-            text["emoji"] = self.emoji
-        return text
+        text = self._resolved
+        if text is None:
+            text = {
+                "type": self._text_type.value,
+                "text": self._text,
+            }
+            if self._text_type == TextType.MARKDOWN:
+                text["verbatim"] = self._verbatim
+            elif self._text_type == TextType.PLAINTEXT and self._emoji:
+                text["emoji"] = self._emoji
+            self._resolved = text
+        # Callers are free to modify what they get back, so hand out a copy
+        # rather than the cache itself.
+        return dict(text)
+
+    @staticmethod
+    def get(text: str,
+            type_: TextType = TextType.MARKDOWN,
+            emoji: Optional[bool] = False,
+            verbatim: Optional[bool] = False) -> "Text":
+        """
+        Fetch a Text object for the given arguments, reusing an existing one
+        (and its cached resolution) where possible.
+        """
+        key = (text, type_, emoji, verbatim)
+        pooled = _TEXT_POOL.get(key)
+        if pooled is None:
+            pooled = Text(text=text, type_=type_, emoji=emoji, verbatim=verbatim)
+            _TEXT_POOL[key] = pooled
+        return pooled
 
     @staticmethod
     def to_text(text: Union[str, "Text"],
-                force_plaintext=False,
+                force_plaintext: bool = False,
                 max_length: Optional[int] = None) -> "Text":
         type_ = TextType.PLAINTEXT if force_plaintext else TextType.MARKDOWN
-        if type(text) is str:
-            if max_length and len(text) > max_length:
-                raise InvalidUsageError("Text length exceeds Slack-imposed limit")
-            return Text(text=text,
-                        type_=type_)
-        else:
-            if max_length and len(text) > max_length:
-                raise InvalidUsageError("Text length exceeds Slack-imposed limit")
-            return Text(text=text.text,
+        raw = text.text if isinstance(text, Text) else text
+        if max_length and len(raw) > max_length:
+            raise InvalidUsageError("Text length exceeds Slack-imposed limit")
+        if isinstance(text, Text) and text.text_type == type_:
+            # Already in the required form; reuse it (and its cached resolution).
+            return text
+        return Text.get(text=raw,
                         type_=type_)
 
+    def to_json(self, *, pretty: bool = False) -> str:
+        """
+        Serialise the text object to a JSON string, as with Block.to_json().
+        """
+        return serialise(self._resolve(), pretty=pretty)
+
     def __str__(self) -> str:
-        return dumps(self._resolve())
+        return self.text
+
+    def __repr__(self) -> str:
+        return "<Text text_type={!r} text={!r}>".format(self.text_type.value, self.text)
 
 
 class Image(Element):
@@ -101,6 +178,10 @@ class Image(Element):
     and context blocks only. If you want a block with only an image in it,
     you're looking for the image block.
     """
+    __slots__ = ("image_url", "alt_text", "_resolved")
+    _TYPE_STR = ElementType.IMAGE.value
+    _resolved: Optional[Dict[str, Any]]
+
     def __init__(self,
                  image_url: str,
                  alt_text: str):
@@ -108,11 +189,19 @@ class Image(Element):
         self.image_url = image_url
         self.alt_text = alt_text
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != "_resolved":
+            super().__setattr__("_resolved", None)
+
     def _resolve(self) -> Dict[str, Any]:
-        image = self._attributes()
-        image["image_url"] = self.image_url
-        image["alt_text"] = self.alt_text
-        return image
+        image = self._resolved
+        if image is None:
+            image = self._attributes()
+            image["image_url"] = self.image_url
+            image["alt_text"] = self.alt_text
+            self._resolved = image
+        return dict(image)
 
 
 class Confirm(Element):
@@ -121,23 +210,54 @@ class Confirm(Element):
     to any interactive element. This dialog will ask the user to confirm
     their action by offering confirm and deny buttons.
     """
+    __slots__ = ("_title", "_text", "_confirm", "_deny")
+    _TYPE_STR = ElementType.CONFIRM.value
+
     def __init__(self,
                  title: Union[str, Text],
                  text: Union[str, Text],
                  confirm: Union[str, Text],
                  deny: Union[str, Text]):
         super().__init__(type_=ElementType.CONFIRM)
-        self.title = Text.to_text(title, max_length=100, force_plaintext=True)
-        self.text = Text.to_text(text, max_length=300)
-        self.confirm = Text.to_text(confirm, max_length=30, force_plaintext=True)
-        self.deny = Text.to_text(deny, max_length=30, force_plaintext=True)
+        # Immutable, like the Text objects it's made of.
+        self._title = Text.to_text(title, max_length=100, force_plaintext=True)
+        self._text = Text.to_text(text, max_length=300)
+        self._confirm = Text.to_text(confirm, max_length=30, force_plaintext=True)
+        self._deny = Text.to_text(deny, max_length=30, force_plaintext=True)
+
+    @property
+    def title(self) -> Text:
+        return self._title
+
+    @property
+    def text(self) -> Text:
+        return self._text
+
+    @property
+    def confirm(self) -> Text:
+        return self._confirm
+
+    @property
+    def deny(self) -> Text:
+        return self._deny
+
+    def _key(self) -> Tuple[Text, Text, Text, Text]:
+        return self._title, self._text, self._confirm, self._deny
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Confirm):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
 
     def _resolve(self) -> Dict[str, Any]:
         return {
-            "title": self.title._resolve(),
-            "text": self.text._resolve(),
-            "confirm": self.confirm._resolve(),
-            "deny": self.deny._resolve()
+            "title": self._title._resolve(),
+            "text": self._text._resolve(),
+            "confirm": self._confirm._resolve(),
+            "deny": self._deny._resolve()
         }
 
 
@@ -147,6 +267,9 @@ class Button(Element):
     trigger for anything from opening a simple link to starting a complex
     workflow.
     """
+    __slots__ = ("text", "action_id", "url", "value", "style", "confirm")
+    _TYPE_STR = ElementType.BUTTON.value
+
     def __init__(self,
                  text: Union[str, Text],
                  action_id: str,
@@ -163,15 +286,20 @@ class Button(Element):
         self.confirm = confirm
 
     def _resolve(self) -> Dict[str, Any]:
-        button = self._attributes()
-        button["text"] = self.text._resolve()
-        button["action_id"] = self.action_id
-        if self.style:
-            button["style"] = self.style
-        if self.url:
-            button["url"] = self.url
-        if self.value:
-            button["value"] = self.value
-        if self.confirm:
-            button["confirm"] = self.confirm._resolve()
+        # Required keys go into a single literal and each optional attribute
+        # is only read once.
+        button = {
+            "type": self._TYPE_STR,
+            "text": self.text._resolve(),
+            "action_id": self.action_id,
+        }
+        style, url, value, confirm = self.style, self.url, self.value, self.confirm
+        if style:
+            button["style"] = style
+        if url:
+            button["url"] = url
+        if value:
+            button["value"] = value
+        if confirm:
+            button["confirm"] = confirm._resolve()
         return button
@@ -2,13 +2,18 @@ from json import dumps
 from typing import Any, Dict, List, Optional, Union
 from .attachments import Attachment
 from .blocks import Block
+from .utils import mypyc_attr
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class BaseMessage:
     """
     Abstract class for shared functionality between Messages and
     Acknowledgement responses.
     """
+    __slots__ = ("channel", "text", "blocks", "attachments", "thread_ts", "mrkdwn")
+    blocks: Optional[List[Block]]
+
     def __init__(self,
                  channel: Optional[str] = None,
                  text: Optional[str] = "",
@@ -16,7 +21,7 @@ class BaseMessage:
                  attachments: Optional[List[Attachment]] = None,
                  thread_ts: Optional[str] = None,
                  mrkdwn: bool = True):
-        if isinstance(blocks, List):
+        if isinstance(blocks, list):
             self.blocks = blocks
         elif isinstance(blocks, Block):
             self.blocks = [blocks, ]
@@ -29,7 +34,7 @@ class BaseMessage:
         self.mrkdwn = mrkdwn
 
     def _resolve(self) -> Dict[str, Any]:
-        message = dict()
+        message: Dict[str, Any] = {}
         if self.channel:
             message["channel"] = self.channel
         message["mrkdwn"] = self.mrkdwn
@@ -49,18 +54,21 @@ class BaseMessage:
     def __repr__(self) -> str:
         return self.json()
 
-    def __getitem__(self, item):
+    def __getitem__(self, item: str) -> Any:
         return self._resolve()[item]
 
     def keys(self) -> Dict[str, Any]:
         return self._resolve()
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class Message(BaseMessage):
     """
     A Slack message object that can be converted to a JSON string for use with
     the Slack message API.
     """
+    __slots__ = ()
+
     def __init__(self,
                  channel: str,
                  text: Optional[str] = "",
@@ -71,10 +79,13 @@ class Message(BaseMessage):
         super().__init__(channel, text, blocks, attachments, thread_ts, mrkdwn)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class MessageResponse(BaseMessage):
     """
     A required, immediate response that confirms your app received the payload.
     """
+    __slots__ = ("replace_original", "ephemeral")
+
     def __init__(self,
                  text: Optional[str] = "",
                  blocks: Optional[Union[List[Block], Block]] = None,
@@ -92,8 +103,8 @@ class MessageResponse(BaseMessage):
         self.ephemeral = ephemeral
 
     def _resolve(self) -> Dict[str, Any]:
-        result = {**super()._resolve(),
-                  "replace_original": self.replace_original}
+        result = super()._resolve()
+        result["replace_original"] = self.replace_original
         if self.ephemeral:
             result["response_type"] = "ephemeral"
         return result
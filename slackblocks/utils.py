@@ -0,0 +1,44 @@
+from json import dumps
+from typing import Any, Callable, TypeVar
+
+try:
+    from orjson import OPT_NON_STR_KEYS, dumps as _orjson_dumps
+except ImportError:  # pragma: no cover
+    _orjson_dumps = None  # type: ignore[assignment]
+
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # pragma: no cover
+    _T = TypeVar("_T")
+
+    # mypy_extensions is only needed for the mypyc build (see setup.py), where
+    # this lets interpreted classes subclass the compiled ones.
+    def mypyc_attr(*attrs: str, **kwattrs: object) -> Callable[[_T], _T]:
+        return lambda cls: cls
+
+
+def compact_dumps(obj: Any) -> str:
+    """
+    Serialise an object to a JSON string without any whitespace, using orjson
+    when it's installed and the standard library otherwise (or for anything
+    orjson refuses, such as integers wider than 64 bits). The output of the two
+    can differ for floats: orjson writes 1e16 where the standard library writes
+    1e+16, and null for NaN and infinity.
+    """
+    if _orjson_dumps is not None:
+        try:
+            return _orjson_dumps(obj, option=OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def serialise(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialise an object to a JSON string, compactly unless pretty is set. Pretty
+    output (four space indent) always comes from the standard library, as orjson
+    only offers a two space indent.
+    """
+    if pretty:
+        return dumps(obj, indent=4)
+    return compact_dumps(obj)
@@ -1,12 +1,16 @@
-from slackblocks import ContextBlock, DividerBlock, ImageBlock, SectionBlock, Text, HeaderBlock, \
-    TextType
+from json import loads
+import pytest
+from slackblocks import BlockList, ContextBlock, DividerBlock, ImageBlock, SectionBlock, Text, \
+    HeaderBlock, TextType, Button
+from slackblocks.blocks import Block, BlockType
+from slackblocks.errors import InvalidUsageError
 
 
 def test_basic_section_block() -> None:
     block = SectionBlock("Hello, world!",
                          block_id="fake_block_id")
     with open("test/samples/section_block_text_only.json", "r") as expected:
-        assert repr(block) == expected.read()
+        assert block.to_json(pretty=True) == expected.read()
 
 
 def test_basic_section_fields() -> None:
@@ -15,20 +19,33 @@ def test_basic_section_fields() -> None:
                                  Text(text='bar')],
                          block_id="fake_block_id")
     with open("test/samples/section_block_fields.json", "r") as expected:
-        assert repr(block) == expected.read()
+        assert block.to_json(pretty=True) == expected.read()
 
 
 def test_basic_context_block() -> None:
     block = ContextBlock(elements=[Text("Hello, world!")],
                          block_id="fake_block_id")
     with open("test/samples/context_block_text_only.json", "r") as expected:
-        assert repr(block) == expected.read()
+        assert block.to_json(pretty=True) == expected.read()
 
 
 def test_basic_divider_block() -> None:
     block = DividerBlock(block_id="fake_block_id")
     with open("test/samples/divider_block_only.json", "r") as expected:
-        assert repr(block) == expected.read()
+        assert block.to_json(pretty=True) == expected.read()
+    block._resolve()["type"] = "section"
+    assert block._resolve()["type"] == "divider"
+
+
+def test_custom_block_subclass() -> None:
+    class CustomDivider(Block):
+        def __init__(self) -> None:
+            super().__init__(type_=BlockType.DIVIDER, block_id="fake_block_id")
+
+        def _resolve(self):
+            return self._attributes()
+
+    assert CustomDivider()._resolve() == {"type": "divider", "block_id": "fake_block_id"}
 
 
 def test_basic_image_block() -> None:
@@ -37,10 +54,52 @@ def test_basic_image_block() -> None:
                        title="image1",
                        block_id="fake_block_id")
     with open("test/samples/image_block_only.json", "r") as expected:
-        assert repr(block) == expected.read()
+        assert block.to_json(pretty=True) == expected.read()
 
 
 def test_basic_header_block() -> None:
     block = HeaderBlock(text="AloHa!", block_id="fake_block_id")
     with open("test/samples/header_block_only.json", "r") as expected:
-        assert repr(block) == expected.read()
+        assert block.to_json(pretty=True) == expected.read()
+
+
+def test_block_repr_is_cheap() -> None:
+    block = SectionBlock("Hello, world!", block_id="fake_block_id")
+    assert repr(block) == "<SectionBlock block_id='fake_block_id'>"
+    assert loads(block.to_json()) == loads(block.to_json(pretty=True))
+
+
+def test_block_id_omitted_until_accessed() -> None:
+    block = DividerBlock()
+    assert "block_id" not in block._resolve()
+    block_id = block.block_id
+    assert block.block_id == block_id
+    assert block._resolve()["block_id"] == block_id
+
+
+def test_context_block_rejects_interactive_elements() -> None:
+    with pytest.raises(InvalidUsageError):
+        ContextBlock(elements=[Text("Hello, world!"), Button("Click me", action_id="click")])
+
+
+def test_block_addition() -> None:
+    block_0 = DividerBlock()
+    block_1 = SectionBlock("Hello, world!")
+    block_2 = DividerBlock()
+    blocks = block_0 + block_1 + block_2
+    assert isinstance(blocks, BlockList)
+    assert blocks == [block_0, block_1, block_2]
+    blocks += [block_1, block_0]
+    blocks += block_2
+    assert blocks == [block_0, block_1, block_2, block_1, block_0, block_2]
+
+
+@pytest.mark.parametrize("other", ["text", {"type": "divider"}, 1, [DividerBlock(), "text"]])
+def test_block_addition_rejects_non_blocks(other) -> None:
+    block = DividerBlock()
+    with pytest.raises(TypeError):
+        block + other
+    blocks = BlockList([block])
+    with pytest.raises(TypeError):
+        blocks += other
+    assert blocks == [block]
@@ -0,0 +1,118 @@
+import pytest
+from slackblocks import Button, Confirm, Image, Text, TextType
+from slackblocks.elements import Element, ElementType
+from slackblocks.errors import InvalidUsageError
+
+
+def test_text_resolve_is_not_shared() -> None:
+    text = Text("Hello, world!")
+    text._resolve()["text"] = "Goodbye, world!"
+    assert text._resolve()["text"] == "Hello, world!"
+
+
+def test_image_resolve_is_not_shared() -> None:
+    image = Image(image_url="https://example.com/cat.png", alt_text="cat")
+    image._resolve()["alt_text"] = "dog"
+    assert image._resolve()["alt_text"] == "cat"
+
+
+def test_text_is_immutable() -> None:
+    text = Text("Hello, world!")
+    with pytest.raises(AttributeError):
+        text.text = "Goodbye, world!"
+    assert text._resolve()["text"] == "Hello, world!"
+
+
+def test_text_type_is_read_only() -> None:
+    text = Button("Yes", action_id="yes").text
+    with pytest.raises(AttributeError):
+        text.type = None
+    assert Button("Yes", action_id="no").text.type == ElementType.TEXT
+
+
+def test_text_equality() -> None:
+    assert Text("Hello") == Text("Hello")
+    assert Text("Hello") != Text("Hello", type_=TextType.PLAINTEXT)
+    assert len({Text("Hello"), Text("Hello")}) == 1
+
+
+def test_confirm_is_immutable() -> None:
+    confirm = Confirm("Sure?", "Really?", "Yes", "No")
+    with pytest.raises(AttributeError):
+        confirm.deny = "Nope"
+    with pytest.raises(AttributeError):
+        confirm.type = None
+    assert confirm == Confirm("Sure?", "Really?", "Yes", "No")
+    confirm._resolve()["deny"]["text"] = "Nope"
+    assert confirm._resolve()["deny"]["text"] == "No"
+
+
+def test_custom_element_subclass() -> None:
+    class CustomImage(Element):
+        def __init__(self) -> None:
+            super().__init__(type_=ElementType.IMAGE)
+
+        def _resolve(self):
+            return self._attributes()
+
+    assert CustomImage()._resolve() == {"type": "image"}
+
+
+def test_button_required_fields_only() -> None:
+    button = Button("Click me", action_id="fake_action_id")
+    assert button._resolve() == {
+        "type": "button",
+        "text": {"type": "plain_text", "text": "Click me"},
+        "action_id": "fake_action_id",
+    }
+
+
+def test_button_optional_fields() -> None:
+    button = Button("Click me",
+                    action_id="fake_action_id",
+                    url="https://example.com",
+                    value="pressed",
+                    style="primary",
+                    confirm=Confirm("Sure?", "Really?", "Yes", "No"))
+    assert list(button._resolve()) == ["type", "text", "action_id", "style",
+                                       "url", "value", "confirm"]
+
+
+def test_to_text_length_limit_applies_to_text_objects() -> None:
+    with pytest.raises(InvalidUsageError):
+        Text.to_text(Text("x" * 31), max_length=30)
+
+
+def test_to_text_reuses_matching_text() -> None:
+    text = Text("Submit", type_=TextType.PLAINTEXT, emoji=True)
+    assert Text.to_text(text, force_plaintext=True) is text
+    assert Text.to_text(text).text_type == TextType.MARKDOWN
+
+
+def test_text_str_and_json() -> None:
+    text = Text("Hello, world!")
+    assert str(text) == "Hello, world!"
+    assert text.to_json() == '{"type":"mrkdwn","text":"Hello, world!","verbatim":false}'
+
+
+def test_to_text_shares_identical_text() -> None:
+    yes = Button("Yes", action_id="yes")
+    confirm = Confirm("Sure?", "Really?", "Yes", "No")
+    assert yes.text is confirm.confirm
+    assert Text.get("Yes") is not yes.text
+
+
+def test_shared_text_payloads_are_independent() -> None:
+    yes = Button("Yes", action_id="yes")
+    confirm = Confirm("Sure?", "Really?", "Yes", "No")
+    yes._resolve()["text"]["text"] = "Yes please"
+    assert confirm._resolve()["confirm"]["text"] == "Yes"
+
+
+def test_plaintext_emoji() -> None:
+    assert Text("Hi :wave:", type_=TextType.PLAINTEXT, emoji=True)._resolve() == {
+        "type": "plain_text",
+        "text": "Hi :wave:",
+        "emoji": True,
+    }
+    assert "emoji" not in Text("Hi", type_=TextType.PLAINTEXT)._resolve()
@@ -1,4 +1,4 @@
-from slackblocks import Attachment, MessageResponse, Color, Message,\
+from slackblocks import Attachment, MessageResponse, Color, Message, \
     SectionBlock
 
 
@@ -22,3 +22,11 @@ def test_message_response() -> None:
     message = MessageResponse(blocks=block, ephemeral=True)
     with open("test/samples/message_response.json", "r") as expected:
         assert repr(message) == expected.read()
+
+
+def test_editing_a_payload_leaves_other_messages_alone() -> None:
+    message = Message(channel="#slackblocks", blocks=SectionBlock("Hello"))
+    payload = message._resolve()
+    payload["blocks"][0]["text"]["text"] = "Goodbye"
+    other = Message(channel="#slackblocks", blocks=SectionBlock("Hello"))
+    assert other._resolve()["blocks"][0]["text"]["text"] == "Hello"
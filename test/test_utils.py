@@ -0,0 +1,7 @@
+from slackblocks.utils import compact_dumps
+
+
+def test_compact_dumps() -> None:
+    assert compact_dumps({"text": "Héllo", "short": True}) == '{"text":"Héllo","short":true}'
+    assert compact_dumps({1: "one"}) == '{"1":"one"}'
+    assert compact_dumps({"big": 2 ** 64}) == '{"big":18446744073709551616}'